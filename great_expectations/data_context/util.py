@@ -1,9 +1,10 @@
-import copy
 import inspect
 import logging
 import os
 import re
-from collections import OrderedDict
+import sys
+from collections import ChainMap
+from functools import lru_cache
 
 from great_expectations.data_context.types.base import (
     DataContextConfig,
@@ -14,6 +15,36 @@ from great_expectations.util import load_class, verify_dynamic_loading_support
 
 logger = logging.getLogger(__name__)
 
+# Matches both forms of config variable reference: ${SOME_VARIABLE} and $SOME_VARIABLE.
+# Compiled once at import time so that the recursive config traversal does not pay
+# a pattern-cache lookup on every string it inspects.
+_SUBSTITUTION_PATTERN = re.compile(r"\$\{(.*?)\}|\$([_a-zA-Z][_a-zA-Z0-9]*)")
+
+# Marshmallow schemas pay field collection and compilation at construction
+# time, so build the one used for config dumps a single time per process.
+_DATA_CONTEXT_CONFIG_SCHEMA = DataContextConfigSchema()
+
+
+@lru_cache(maxsize=None)
+def _cached_load_class(class_name, module_name):
+    """Resolve a class by name once per process; DataContext construction resolves
+    the same (class_name, module_name) pairs repeatedly."""
+    return load_class(class_name=class_name, module_name=module_name)
+
+
+@lru_cache(maxsize=None)
+def _cached_verify_dynamic_loading_support(module_name):
+    verify_dynamic_loading_support(module_name=module_name)
+
+
+@lru_cache(maxsize=None)
+def _init_argspec(class_):
+    """Positional argument names of class_.__init__, excluding self.
+
+    inspect.getfullargspec re-parses the signature on every call, so cache the
+    result per class."""
+    return tuple(inspect.getfullargspec(class_.__init__)[0][1:])
+
 
 # TODO: Rename config to constructor_kwargs and config_defaults -> constructor_kwarg_default
 # TODO: Improve error messages in this method. Since so much of our workflow is config-driven, this will be a *super* important part of DX.
@@ -23,23 +54,27 @@ def instantiate_class_from_config(config, runtime_environment, config_defaults=N
     if config_defaults is None:
         config_defaults = {}
 
-    config = copy.deepcopy(config)
+    # Copy the config one level deep: top-level module_name/class_name keys are
+    # popped below, and some constructors write default keys into nested config
+    # dicts they receive (e.g. the store classes filling in store_backend
+    # defaults), which must not leak back into the caller's config. Nothing
+    # mutates deeper than one level, so a full deepcopy is not needed.
+    config = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    }
 
     module_name = config.pop("module_name", None)
     if module_name is None:
-        try:
-            module_name = config_defaults.pop("module_name")
-        except KeyError:
+        module_name = config_defaults.get("module_name")
+        if module_name is None:
             raise KeyError(
                 "Neither config : {} nor config_defaults : {} contains a module_name key.".format(
                     config, config_defaults,
                 )
             )
-    else:
-        # Pop the value without using it, to avoid sending an unwanted value to the config_class
-        config_defaults.pop("module_name", None)
 
-    verify_dynamic_loading_support(module_name=module_name)
+    _cached_verify_dynamic_loading_support(module_name)
 
     class_name = config.pop("class_name", None)
     if class_name is None:
@@ -47,38 +82,36 @@ def instantiate_class_from_config(config, runtime_environment, config_defaults=N
             "Instantiating class from config without an explicit class_name is dangerous. Consider adding "
             "an explicit class_name for %s" % config.get("name")
         )
-        try:
-            class_name = config_defaults.pop("class_name")
-        except KeyError:
+        class_name = config_defaults.get("class_name")
+        if class_name is None:
             raise KeyError(
                 "Neither config : {} nor config_defaults : {} contains a class_name key.".format(
                     config, config_defaults,
                 )
             )
-    else:
-        # Pop the value without using it, to avoid sending an unwanted value to the config_class
-        config_defaults.pop("class_name", None)
 
-    class_ = load_class(class_name=class_name, module_name=module_name)
+    class_ = _cached_load_class(class_name, module_name)
 
-    config_with_defaults = copy.deepcopy(config_defaults)
+    # Exclude module_name/class_name here rather than popping them off
+    # config_defaults above, so the caller's dict is never mutated and can be
+    # a shared constant.
+    config_with_defaults = {
+        key: value
+        for key, value in config_defaults.items()
+        if key not in ("module_name", "class_name")
+    }
     config_with_defaults.update(config)
     if runtime_environment is not None:
         # If there are additional kwargs available in the runtime_environment requested by a
         # class to be instantiated, provide them
-        argspec = inspect.getfullargspec(class_.__init__)[0][1:]
-
-        missing_args = set(argspec) - set(config_with_defaults.keys())
-        config_with_defaults.update(
-            {
-                missing_arg: runtime_environment[missing_arg]
-                for missing_arg in missing_args
-                if missing_arg in runtime_environment
-            }
-        )
-        # Add the entire runtime_environment as well if it's requested
-        if "runtime_environment" in missing_args:
-            config_with_defaults.update({"runtime_environment": runtime_environment})
+        for missing_arg in _init_argspec(class_):
+            if missing_arg in config_with_defaults:
+                continue
+            if missing_arg == "runtime_environment":
+                # Add the entire runtime_environment if it's requested
+                config_with_defaults["runtime_environment"] = runtime_environment
+            elif missing_arg in runtime_environment:
+                config_with_defaults[missing_arg] = runtime_environment[missing_arg]
 
     try:
         class_instance = class_(**config_with_defaults)
@@ -96,69 +129,173 @@ def instantiate_class_from_config(config, runtime_environment, config_defaults=N
 def format_dict_for_error_message(dict_):
     # TODO : Tidy this up a bit. Indentation isn't fully consistent.
 
-    return "\n\t".join("\t\t".join((str(key), str(dict_[key]))) for key in dict_)
+    return "\n\t".join(f"{key}\t\t{value}" for key, value in dict_.items())
+
+
+# Upper bound on chained substitutions (a config variable whose value itself
+# contains config variable references). Guards against self-referential cycles.
+_MAX_SUBSTITUTION_DEPTH = 10
+
+
+def _match_variable_name(match):
+    """Extract the variable name from a _SUBSTITUTION_PATTERN match.
+
+    Group 1 captures the ${VARIABLE} form, group 2 the bare $VARIABLE form; no
+    further cleanup of the matched text is needed. The name is interned so the
+    dict probes during lookup compare by pointer: the same few variable names
+    recur across hundreds of templated config values."""
+    variable_name = match.group(1)
+    if variable_name is None:
+        variable_name = match.group(2)
+    return sys.intern(variable_name)
+
+
+def _get_substitution_value(variable_name, config_variables_lookup):
+    """Look up a single config variable in the combined config/environment mapping."""
+    config_variable_value = config_variables_lookup.get(variable_name)
+    if config_variable_value is None:
+        raise MissingConfigVariableError(
+            f"""\n\nUnable to find a match for config substitution variable: `{variable_name}`.
+Please add this missing variable to your `uncommitted/config_variables.yml` file or your environment variables.
+See https://great-expectations.readthedocs.io/en/latest/reference/data_context_reference.html#managing-environment-and-secrets""",
+            missing_config_variable=variable_name,
+        )
+    return config_variable_value
+
+
+# Opt-in memoization of substitution results, keyed by the template string and
+# the identity of the config variables dict. Substitution also depends on the
+# process environment, which test suites routinely mutate mid-run, so the cache
+# is only enabled when GE_CACHE_CONFIG_SUBSTITUTIONS is set and the caller can
+# guarantee that neither the environment nor the config variables change.
+_SUBSTITUTION_CACHE_ENABLED = os.environ.get(
+    "GE_CACHE_CONFIG_SUBSTITUTIONS", ""
+).lower() in ("true", "yes", "1")
+_substitution_cache = {}
+# The config variables dict the cached results were computed against. A strong
+# reference is kept deliberately: comparing by identity alone would be fooled
+# by a dead dict's id being recycled for a new instance.
+_substitution_cache_source = None
+
+
+@lru_cache(maxsize=4096)
+def _compile_substitution_template(template_str):
+    """Split template_str into literal fragments and the variable names between them.
+
+    Returns (literals, variable_names) where literals always has one more element
+    than variable_names and the original string is
+    literals[0] + <var 0> + literals[1] + ... + literals[-1]. The split is cached
+    per template so repeated substitution of the same config skips the regex scan
+    entirely and only re-runs the lookups and the join.
+    """
+    literals = []
+    variable_names = []
+    # Bind the per-iteration attribute lookups to locals; LOAD_FAST is cheaper
+    # than re-resolving the module global and the method attributes each match.
+    finditer = _SUBSTITUTION_PATTERN.finditer
+    append_literal = literals.append
+    append_variable_name = variable_names.append
+    position = 0
+    for match in finditer(template_str):
+        append_literal(template_str[position : match.start()])
+        append_variable_name(_match_variable_name(match))
+        position = match.end()
+    append_literal(template_str[position:])
+    return tuple(literals), tuple(variable_names)
+
+
+def _substitute_template(template_str, config_variables_lookup):
+    """Resolve all config variable references in template_str; see
+    substitute_config_variable for semantics."""
+    for _ in range(_MAX_SUBSTITUTION_DEPTH):
+        literals, variable_names = _compile_substitution_template(template_str)
+        if not variable_names:
+            return template_str
+
+        if len(variable_names) == 1 and literals[0] == "" and literals[1] == "":
+            # A leaf value that is exactly one substitution (e.g. "${MY_HOST}").
+            config_variable_value = _get_substitution_value(
+                variable_names[0], config_variables_lookup
+            )
+            if not isinstance(config_variable_value, str):
+                # A template that is exactly one substitution keeps the original
+                # type of its value (e.g. a nested dict of credentials).
+                return config_variable_value
+            substituted = config_variable_value
+        else:
+            parts = [literals[0]]
+            for variable_name, literal in zip(variable_names, literals[1:]):
+                parts.append(
+                    str(_get_substitution_value(variable_name, config_variables_lookup))
+                )
+                parts.append(literal)
+            substituted = "".join(parts)
+
+        if substituted == template_str or "$" not in substituted:
+            return substituted
+        template_str = substituted
+
+    return template_str
 
 
-def substitute_config_variable(template_str, config_variables_dict):
+def substitute_config_variable(template_str, config_variables_dict, environment=None):
     """
     This method takes a string, and if it contains a pattern ${SOME_VARIABLE} or $SOME_VARIABLE,
-    returns a string where the pattern is replaced with the value of SOME_VARIABLE,
+    returns a string where every such pattern is replaced with the value of SOME_VARIABLE,
     otherwise returns the string unchanged.
 
-    If the environment variable SOME_VARIABLE is set, the method uses its value for substitution.
-    If it is not set, the value of SOME_VARIABLE is looked up in the config variables store (file).
-    If it is not found there, the input string is returned as is.
+    The value of SOME_VARIABLE is looked up in the config variables store (file) first,
+    then in the environment variables. If the substituted value itself contains a
+    config variable reference, that reference is resolved in turn. If a variable is
+    not found in either place, a MissingConfigVariableError is raised.
 
-    :param template_str: a string that might or might not be of the form ${SOME_VARIABLE}
-            or $SOME_VARIABLE
+    :param template_str: a string that might or might not contain patterns of the form
+            ${SOME_VARIABLE} or $SOME_VARIABLE
     :param config_variables_dict: a dictionary of config variables. It is loaded from the
             config variables store (by default, "uncommitted/config_variables.yml file)
+    :param environment: an optional mapping used for the environment-variable fallback.
+            Defaults to os.environ; callers that substitute many values can pass a
+            plain-dict snapshot of the environment to avoid repeated os.environ access.
     :return:
     """
     if template_str is None:
         return template_str
 
+    if environment is None:
+        environment = os.environ
+
     try:
-        match = re.search(r"\$\{(.*?)\}", template_str) or re.search(
-            r"\$([_a-z][_a-z0-9]*)", template_str
-        )
+        # The overwhelmingly common case is a value with nothing to substitute;
+        # reject it with a single substring check before entering the regex engine.
+        if "$" not in template_str:
+            return template_str
     except TypeError:
         # If the value is not a string (e.g., a boolean), we should return it as is
         return template_str
 
-    if match:
-        config_variable_value = config_variables_dict.get(match.group(1))
-        try:
-            inner_match = re.search(r"\$\{(.*?)\}", config_variable_value) or re.search(
-                r"\$([_a-z][_a-z0-9]*)", config_variable_value
-            )
-        except TypeError:
-            inner_match = None
-
-        if inner_match:
-            config_variable_value = os.getenv(inner_match.group(1))
+    # A single mapping that resolves from the config variables dict first, then
+    # the environment, so each candidate needs only one .get.
+    config_variables_lookup = ChainMap(config_variables_dict, environment)
 
-        if config_variable_value is not None:
-            if match.start() == 0 and match.end() == len(template_str):
-                return config_variable_value
-            else:
-                return (
-                    template_str[: match.start()]
-                    + config_variable_value
-                    + template_str[match.end() :]
-                )
+    if not _SUBSTITUTION_CACHE_ENABLED:
+        return _substitute_template(template_str, config_variables_lookup)
 
-        raise MissingConfigVariableError(
-            f"""\n\nUnable to find a match for config substitution variable: `{match.group(1)}`.
-Please add this missing variable to your `uncommitted/config_variables.yml` file or your environment variables.
-See https://great-expectations.readthedocs.io/en/latest/reference/data_context_reference.html#managing-environment-and-secrets""",
-            missing_config_variable=match.group(1),
-        )
+    global _substitution_cache_source
+    if config_variables_dict is not _substitution_cache_source:
+        # A different config variables dict invalidates every cached result;
+        # this also keeps the cache bounded by the templates of one config.
+        _substitution_cache.clear()
+        _substitution_cache_source = config_variables_dict
 
-    return template_str
+    try:
+        return _substitution_cache[template_str]
+    except KeyError:
+        substituted = _substitute_template(template_str, config_variables_lookup)
+        _substitution_cache[template_str] = substituted
+        return substituted
 
 
-def substitute_all_config_variables(data, replace_variables_dict):
+def substitute_all_config_variables(data, replace_variables_dict, environment=None):
     """
     Substitute all config variables of the form ${SOME_VARIABLE} in a dictionary-like
     config object for their values.
@@ -167,21 +304,106 @@ def substitute_all_config_variables(data, replace_variables_dict):
 
     :param data:
     :param replace_variables_dict:
+    :param environment: a snapshot of the environment variables, taken once at the top
+            of the traversal so per-leaf lookups are plain dict gets.
     :return: a dictionary with all the variables replaced with their values
+
+    Subtrees containing no substitutions are shared with the input rather than
+    copied; the input is never mutated, but the result should be treated as
+    read-only (or copied) by callers that want to modify it.
     """
-    if isinstance(data, DataContextConfig):
-        data = DataContextConfigSchema().dump(data)
-
-    if isinstance(data, dict) or isinstance(data, OrderedDict):
-        return {
-            k: substitute_all_config_variables(v, replace_variables_dict)
-            for k, v in data.items()
-        }
-    elif isinstance(data, list):
-        return [
-            substitute_all_config_variables(v, replace_variables_dict) for v in data
-        ]
-    return substitute_config_variable(data, replace_variables_dict)
+    if environment is None:
+        environment = dict(os.environ)
+
+    # Exact-type checks are a single pointer compare and cover the overwhelming
+    # majority of nodes; the isinstance fallbacks keep dict/list subclasses
+    # (OrderedDict, ruamel.yaml's comment-preserving containers) working.
+    data_type = type(data)
+    if data_type is not dict and data_type is not list:
+        if isinstance(data, DataContextConfig):
+            data = _DATA_CONTEXT_CONFIG_SCHEMA.dump(data)
+        elif not isinstance(data, (dict, list)):
+            return substitute_config_variable(data, replace_variables_dict, environment)
+
+    # Walk with an explicit stack rather than recursing: deeply nested configs
+    # would otherwise pay one Python frame per node (and can hit the recursion
+    # limit). Containers are collected in post-order (every container after all
+    # the containers it references, even when a container is referenced from
+    # several places, as yaml anchors/aliases produce), then rebuilt in that
+    # order, allocating a replacement container only when one of its entries
+    # actually changed; most of a typical config is untouched and allocates
+    # nothing.
+    ordered = []
+    # Containers expanded but not yet emitted. Doubles as the cycle guard:
+    # a back-reference to an ancestor (yaml supports recursive anchors) is
+    # skipped instead of spinning forever.
+    visiting = set()
+    done = set()
+    stack = [(data, False)]
+    while stack:
+        container, expanded = stack.pop()
+        container_id = id(container)
+        if expanded:
+            visiting.discard(container_id)
+            done.add(container_id)
+            ordered.append(container)
+            continue
+        if container_id in done or container_id in visiting:
+            continue
+        visiting.add(container_id)
+        stack.append((container, True))
+        if type(container) is dict or isinstance(container, dict):
+            values = container.values()
+        else:
+            values = container
+        for value in values:
+            value_type = type(value)
+            if (
+                value_type is dict
+                or value_type is list
+                or isinstance(value, (dict, list))
+            ):
+                stack.append((value, False))
+
+    replacements = {}
+    for container in ordered:
+        if type(container) is dict or isinstance(container, dict):
+            items = container.items()
+            copy_container = dict
+        else:
+            items = enumerate(container)
+            copy_container = list
+        rebuilt = None
+        for key, value in items:
+            value_type = type(value)
+            if value_type is str:
+                # Strings are by far the most common leaf; dispatch on exact
+                # type before paying any isinstance checks.
+                new_value = substitute_config_variable(
+                    value, replace_variables_dict, environment
+                )
+            elif (
+                value_type is dict
+                or value_type is list
+                or isinstance(value, (dict, list))
+            ):
+                new_value = replacements.get(id(value), value)
+            elif isinstance(value, DataContextConfig):
+                new_value = substitute_all_config_variables(
+                    value, replace_variables_dict, environment
+                )
+            else:
+                new_value = substitute_config_variable(
+                    value, replace_variables_dict, environment
+                )
+            if new_value is not value:
+                if rebuilt is None:
+                    rebuilt = copy_container(container)
+                rebuilt[key] = new_value
+        if rebuilt is not None:
+            replacements[id(container)] = rebuilt
+
+    return replacements.get(id(data), data)
 
 
 def file_relative_path(dunderfile, relative_path):
@@ -151,6 +151,31 @@ def test_substituted_config_variables_not_written_to_file(tmp_path_factory):
     assert context_config_dict == expected_config_dict
 
 
+def test_store_instantiation_does_not_write_into_project_config(tmp_path_factory):
+    # Store constructors fill defaults (e.g. filepath_suffix) into the
+    # store_backend config they receive. Since substitution shares unchanged
+    # subtrees with the project config instead of copying them, those writes
+    # must never reach context._project_config through an aliased dict.
+
+    project_path = str(tmp_path_factory.mktemp("data_context"))
+    context_path = os.path.join(project_path, "great_expectations")
+    asset_config_path = os.path.join(context_path, "expectations")
+
+    create_data_context_files(
+        context_path,
+        asset_config_path,
+        ge_config_fixture_filename="great_expectations_basic_with_variables.yml",
+        config_variables_fixture_filename="config_variables.yml",
+    )
+
+    context = ge.data_context.DataContext(context_path)
+
+    store_backend = context._project_config["stores"]["expectations_store"][
+        "store_backend"
+    ]
+    assert "filepath_suffix" not in store_backend
+
+
 def test_runtime_environment_are_used_preferentially(tmp_path_factory):
     value_from_environment = "from_environment"
     os.environ["replace_me"] = value_from_environment
@@ -192,7 +217,7 @@ def test_runtime_environment_are_used_preferentially(tmp_path_factory):
         del os.environ["replace_me"]
 
 
-def test_substitute_config_variable():
+def test_substitute_config_variable(monkeypatch):
     config_variables_dict = {"arg0": "val_of_arg_0", "arg2": {"v1": 2}}
     assert (
         substitute_config_variable("abc${arg0}", config_variables_dict)
@@ -222,6 +247,69 @@ See https://great-expectations.readthedocs.io/en/latest/reference/data_context_r
     )
     assert exc.value.missing_config_variable == "arg1"
 
+    # all occurrences in a string are substituted, not just the first
+    assert (
+        substitute_config_variable("${arg0}/${arg0}", config_variables_dict)
+        == "val_of_arg_0/val_of_arg_0"
+    )
+
+    # a variable that is not in the config variables dict falls back to the
+    # environment, for both reference forms (including uppercase bare names)
+    monkeypatch.setenv("ARG_FROM_ENV", "val_from_env")
+    assert (
+        substitute_config_variable("${ARG_FROM_ENV}", config_variables_dict)
+        == "val_from_env"
+    )
+    assert (
+        substitute_config_variable("abc$ARG_FROM_ENV", config_variables_dict)
+        == "abcval_from_env"
+    )
+    with pytest.raises(MissingConfigVariableError):
+        substitute_config_variable("abc$NotDefinedAnywhere", config_variables_dict)
+
+    # a substituted value that itself contains a reference is resolved in turn
+    chained_variables_dict = {"arg3": "${arg4}", "arg4": "final_value"}
+    assert (
+        substitute_config_variable("${arg3}", chained_variables_dict) == "final_value"
+    )
+
+    # self-referential variables terminate instead of recursing forever
+    cyclic_variables_dict = {"cycle": "${cycle}"}
+    assert substitute_config_variable("${cycle}", cyclic_variables_dict) == "${cycle}"
+    mutually_cyclic_variables_dict = {"ping": "${pong}", "pong": "${ping}"}
+    assert substitute_config_variable("${ping}", mutually_cyclic_variables_dict) in (
+        "${ping}",
+        "${pong}",
+    )
+
+
+def test_substitute_all_config_variables_handles_shared_containers():
+    # the same dict object referenced from two keys (what yaml anchors/aliases
+    # produce) must be substituted at both references, regardless of which
+    # reference is discovered first
+    shared = {"v": "${arg0}"}
+    config = {"a": shared, "b": {"x": shared}}
+    result = substitute_all_config_variables(config, {"arg0": "val_of_arg_0"})
+    assert result["a"]["v"] == "val_of_arg_0"
+    assert result["b"]["x"]["v"] == "val_of_arg_0"
+
+    config = {"b": {"x": shared}, "a": shared}
+    result = substitute_all_config_variables(config, {"arg0": "val_of_arg_0"})
+    assert result["a"]["v"] == "val_of_arg_0"
+    assert result["b"]["x"]["v"] == "val_of_arg_0"
+
+    # the input structure is never mutated
+    assert shared["v"] == "${arg0}"
+
+
+def test_substitute_all_config_variables_terminates_on_cyclic_containers():
+    # yaml recursive anchors can produce self-referential structures; the
+    # traversal must terminate and still substitute the reachable leaves
+    cyclic = {"v": "${arg0}"}
+    cyclic["self"] = cyclic
+    result = substitute_all_config_variables(cyclic, {"arg0": "val_of_arg_0"})
+    assert result["v"] == "val_of_arg_0"
+
 
 def test_substitute_env_var_in_config_variable_file(monkeypatch):
     monkeypatch.setenv("FOO", "val_of_arg_0")